@@ -10,20 +10,52 @@ Author: Crypto Challenge Repository
 License: MIT
 """
 
+import asyncio
 import json
+import math
+import os
 import time
-import requests
-from typing import Dict, List, Optional, Tuple
+import httpx
+import numpy as np
+from typing import Any, Dict, List, Optional, Tuple
 from decimal import Decimal
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    from tenacity import AsyncRetrying, stop_after_attempt, wait_exponential
+except ImportError:
+    AsyncRetrying = None
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+try:
+    import _router  # compiled route-scoring kernels (see _router.pyx)
+except ImportError:
+    _router = None
+
 class BaseNetwork(Enum):
     """Base network configurations"""
     MAINNET = "base"
     TESTNET = "base-goerli"
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class NetConfig:
+    """Immutable per-network configuration, resolved at import time"""
+    rpc_url: str
+    chain_id: int
+
+# Per-network settings; looked up once in __init__ instead of going
+# through dict-per-access on a class attribute
+_CONFIGS = {
+    BaseNetwork.MAINNET: NetConfig("https://mainnet.base.org", 8453),
+    BaseNetwork.TESTNET: NetConfig("https://goerli.base.org", 84531),
+}
+
+@dataclass(slots=True)
 class TokenInfo:
     """Token information structure"""
     address: str
@@ -32,7 +64,7 @@ class TokenInfo:
     name: str
     is_native: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class PoolInfo:
     """Liquidity pool information"""
     address: str
@@ -48,12 +80,6 @@ class BaseEcosystemIntegration:
     Provides utilities for DeFi operations on Base blockchain
     """
     
-    # Base network RPC endpoints
-    RPC_ENDPOINTS = {
-        BaseNetwork.MAINNET: "https://mainnet.base.org",
-        BaseNetwork.TESTNET: "https://goerli.base.org"
-    }
-    
     # Common Base ecosystem token addresses
     BASE_TOKENS = {
         "ETH": TokenInfo("0x0000000000000000000000000000000000000000", "ETH", 18, "Ethereum", True),
@@ -61,44 +87,163 @@ class BaseEcosystemIntegration:
         "WETH": TokenInfo("0x4200000000000000000000000000000000000006", "WETH", 18, "Wrapped Ether"),
         "cbETH": TokenInfo("0x2Ae3F1Ec7F1F5012CFEab0185bfc7aa3cf0DEc22", "cbETH", 18, "Coinbase Wrapped Staked ETH"),
     }
-    
-    def __init__(self, network: BaseNetwork = BaseNetwork.MAINNET):
+
+    # Cache TTLs per data class: prices go stale fast, metadata doesn't
+    PRICE_TTL = 300  # seconds
+    METADATA_TTL = 3600  # seconds
+
+    def __init__(self,
+                 network: BaseNetwork = BaseNetwork.MAINNET,
+                 rpc_batch_size: int = 20,
+                 rpc_batching_enabled: bool = True):
         """Initialize Base ecosystem integration"""
         self.network = network
-        self.rpc_url = self.RPC_ENDPOINTS[network]
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Content-Type': 'application/json',
-            'User-Agent': 'BaseEcosystemIntegration/1.0'
-        })
-    
-    def get_token_price(self, token_address: str) -> Optional[float]:
+        self._cfg = _CONFIGS[network]
+        self.rpc_url = self._cfg.rpc_url
+        self.chain_id = self._cfg.chain_id
+        self.rpc_batch_size = rpc_batch_size
+        # Some providers penalize batched requests; disable to fall back
+        # to parallel single-call POSTs via asyncio.gather
+        self.rpc_batching_enabled = rpc_batching_enabled
+        self.session: Optional[httpx.AsyncClient] = None
+        # In-memory price cache: key -> (price, expires_at); backed by an
+        # on-disk cache when diskcache is installed so restarts stay warm
+        self._price_cache: Dict[str, Tuple[Optional[float], float]] = {}
+        self._farming_cache: Optional[Tuple[List[Dict], float]] = None
+        if diskcache is not None:
+            self._disk_cache = diskcache.Cache(os.path.expanduser('~/.base_integration_cache'))
+        else:
+            self._disk_cache = None
+
+    async def connect(self) -> None:
+        """Create the shared HTTP client (lazy, idempotent)"""
+        if self.session is None or self.session.is_closed:
+            # HTTP/2 multiplexes concurrent in-flight requests over one
+            # connection, so gathered calls avoid per-request setup and
+            # head-of-line blocking at the TCP level
+            self.session = httpx.AsyncClient(http2=True, timeout=10.0, headers={
+                'Content-Type': 'application/json',
+                'User-Agent': 'BaseEcosystemIntegration/1.0'
+            })
+
+    async def close(self) -> None:
+        """Close the shared HTTP client"""
+        if self.session is not None and not self.session.is_closed:
+            await self.session.aclose()
+
+    async def _fetch_json(self, method: str, url: str, **kwargs) -> Optional[Dict]:
+        """
+        Perform an HTTP request and return the decoded JSON body
+
+        Retries with exponential backoff when tenacity is installed.
+        Returns None on non-200 responses.
+        """
+        await self.connect()
+
+        async def _once() -> Optional[Dict]:
+            response = await self.session.request(method, url, **kwargs)
+            if response.status_code == 200:
+                return response.json()
+            return None
+
+        if AsyncRetrying is None:
+            return await _once()
+
+        async for attempt in AsyncRetrying(stop=stop_after_attempt(3),
+                                           wait=wait_exponential(multiplier=0.5, max=5),
+                                           reraise=True):
+            with attempt:
+                return await _once()
+
+    def _price_cache_key(self, token_address: str) -> str:
+        """Cache key for a token price, scoped by network"""
+        return f"{self.network.value}:{token_address.lower()}"
+
+    def _get_cached_price(self, token_address: str, now: float) -> Optional[float]:
+        """Look a price up in the memory cache, then the disk cache"""
+        cache_key = self._price_cache_key(token_address)
+
+        cached = self._price_cache.get(cache_key)
+        if cached is not None and now < cached[1]:
+            return cached[0]
+
+        if self._disk_cache is not None:
+            price = self._disk_cache.get(cache_key)
+            if price is not None:
+                self._price_cache[cache_key] = (price, now + self.PRICE_TTL)
+                return price
+
+        return None
+
+    def _store_price(self, token_address: str, price: float, now: float) -> None:
+        """Store a fetched price in both cache tiers"""
+        cache_key = self._price_cache_key(token_address)
+        self._price_cache[cache_key] = (price, now + self.PRICE_TTL)
+        if self._disk_cache is not None:
+            self._disk_cache.set(cache_key, price, expire=self.PRICE_TTL)
+
+    async def get_token_price(self, token_address: str) -> Optional[float]:
         """
         Get current token price in USD
-        
+
         Args:
             token_address: Token contract address
-            
+
         Returns:
             Token price in USD or None if not found
         """
+        prices = await self.get_token_prices([token_address])
+        return prices.get(token_address)
+
+    async def get_token_prices(self, addresses: List[str]) -> Dict[str, Optional[float]]:
+        """
+        Get prices for multiple tokens in one batched request
+
+        Cache hits are served locally; only the missing addresses are
+        comma-joined into a single call to CoinGecko's multi-token
+        endpoint, so N tokens cost at most one HTTP round trip and one
+        rate-limit debit.
+
+        Args:
+            addresses: Token contract addresses
+
+        Returns:
+            Mapping of address to price in USD (None if not found)
+        """
+        now = time.time()
+        prices: Dict[str, Optional[float]] = {}
+        missing: List[str] = []
+
+        for address in addresses:
+            price = self._get_cached_price(address, now)
+            if price is not None:
+                prices[address] = price
+            else:
+                missing.append(address)
+
+        if not missing:
+            return prices
+
+        data = None
         try:
             # Using a price API (placeholder - would use actual API)
             url = f"https://api.coingecko.com/api/v3/simple/token_price/base"
             params = {
-                'contract_addresses': token_address,
+                'contract_addresses': ",".join(a.lower() for a in missing),
                 'vs_currencies': 'usd'
             }
-            
-            response = self.session.get(url, params=params, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                return data.get(token_address.lower(), {}).get('usd')
-            
+            data = await self._fetch_json('GET', url, params=params)
+
         except Exception as e:
-            print(f"Error fetching token price: {e}")
-        
-        return None
+            print(f"Error fetching token prices: {e}")
+
+        for address in missing:
+            price = (data or {}).get(address.lower(), {}).get('usd')
+            if price is not None:
+                self._store_price(address, price, now)
+            prices[address] = price
+
+        return prices
     
     def calculate_swap_output(self, 
                             amount_in: float, 
@@ -119,15 +264,44 @@ class BaseEcosystemIntegration:
         """
         if reserve_in <= 0 or reserve_out <= 0:
             return 0
-        
-        # Apply fee
-        amount_in_with_fee = amount_in * (1 - fee_rate)
-        
-        # Constant product formula: x * y = k
-        numerator = amount_in_with_fee * reserve_out
-        denominator = reserve_in + amount_in_with_fee
-        
+
+        # Uniswap V2's fixed-point fee form (0.3% -> 997/1000); with
+        # integer amounts and reserves this stays in exact integer
+        # arithmetic and matches on-chain quotes bit-for-bit
+        fee_num = int((1 - fee_rate) * 1000)
+        numerator = amount_in * fee_num * reserve_out
+        denominator = reserve_in * 1000 + amount_in * fee_num
+
         return numerator / denominator
+
+    def calculate_swap_output_batch(self,
+                                    amount_in: float,
+                                    reserves_in: np.ndarray,
+                                    reserves_out: np.ndarray,
+                                    fee_rates: np.ndarray) -> np.ndarray:
+        """
+        Calculate swap outputs for many pools in one vectorized pass
+
+        Args:
+            amount_in: Input token amount
+            reserves_in: Input token reserves, one per pool
+            reserves_out: Output token reserves, one per pool
+            fee_rates: Swap fee rates, one per pool
+
+        Returns:
+            Expected output amounts, one per pool (0 for empty pools)
+        """
+        reserves_in = np.asarray(reserves_in, dtype=np.float64)
+        reserves_out = np.asarray(reserves_out, dtype=np.float64)
+        fee_nums = np.floor((1 - np.asarray(fee_rates, dtype=np.float64)) * 1000)
+
+        numerator = amount_in * fee_nums * reserves_out
+        denominator = reserves_in * 1000 + amount_in * fee_nums
+
+        outputs = np.zeros_like(reserves_in)
+        valid = (reserves_in > 0) & (reserves_out > 0)
+        np.divide(numerator, denominator, out=outputs, where=valid)
+        return outputs
     
     def find_optimal_swap_route(self, 
                                token_in: str, 
@@ -147,30 +321,49 @@ class BaseEcosystemIntegration:
         # Simplified routing logic
         direct_pools = self._get_direct_pools(token_in, token_out)
         multi_hop_routes = self._get_multi_hop_routes(token_in, token_out)
-        
+
         best_route = {
             'route': [token_in, token_out],
             'expected_output': 0,
             'price_impact': 0,
             'gas_estimate': 150000
         }
-        
-        # Evaluate direct pools
-        for pool in direct_pools:
-            output = self.calculate_swap_output(
-                amount_in, 
-                pool['reserve_in'], 
-                pool['reserve_out'],
-                pool['fee_rate']
-            )
-            
-            if output > best_route['expected_output']:
+
+        # Score all direct pools and pick the best: the compiled router
+        # runs the loop at C speed when built, otherwise NumPy scores
+        # every pool in one vectorized pass
+        if len(direct_pools['addresses']) > 0:
+            if _router is not None:
+                best = _router.best_route(
+                    np.ascontiguousarray(direct_pools['reserves_in']),
+                    np.ascontiguousarray(direct_pools['reserves_out']),
+                    np.ascontiguousarray(direct_pools['fee_rates']),
+                    amount_in
+                )
+                best_output = _router.swap_out(
+                    amount_in,
+                    float(direct_pools['reserves_in'][best]),
+                    float(direct_pools['reserves_out'][best]),
+                    float(direct_pools['fee_rates'][best])
+                )
+            else:
+                outputs = self.calculate_swap_output_batch(
+                    amount_in,
+                    direct_pools['reserves_in'],
+                    direct_pools['reserves_out'],
+                    direct_pools['fee_rates']
+                )
+                best = int(np.argmax(outputs))
+                best_output = float(outputs[best])
+
+            if best_output > best_route['expected_output']:
                 best_route.update({
-                    'expected_output': output,
-                    'pool_address': pool['address'],
-                    'price_impact': self._calculate_price_impact(amount_in, pool['reserve_in'])
+                    'expected_output': best_output,
+                    'pool_address': direct_pools['addresses'][best],
+                    'price_impact': self._calculate_price_impact(
+                        amount_in, float(direct_pools['reserves_in'][best]))
                 })
-        
+
         return best_route
     
     def get_farming_opportunities(self) -> List[Dict]:
@@ -180,6 +373,9 @@ class BaseEcosystemIntegration:
         Returns:
             List of farming opportunities with APY and TVL
         """
+        if self._farming_cache is not None and time.time() < self._farming_cache[1]:
+            return self._farming_cache[0]
+
         opportunities = [
             {
                 'protocol': 'Uniswap V3',
@@ -209,8 +405,10 @@ class BaseEcosystemIntegration:
                 'fee_tier': 100
             }
         ]
-        
-        return sorted(opportunities, key=lambda x: x['apy'], reverse=True)
+
+        result = sorted(opportunities, key=lambda x: x['apy'], reverse=True)
+        self._farming_cache = (result, time.time() + self.METADATA_TTL)
+        return result
     
     def calculate_impermanent_loss(self, 
                                  initial_price_ratio: float, 
@@ -229,13 +427,30 @@ class BaseEcosystemIntegration:
             return 0
         
         ratio_change = current_price_ratio / initial_price_ratio
-        sqrt_ratio = ratio_change ** 0.5
-        
+        sqrt_ratio = math.sqrt(ratio_change)
+
         # IL formula: 2 * sqrt(ratio) / (1 + ratio) - 1
         il = 2 * sqrt_ratio / (1 + ratio_change) - 1
-        
+
         return abs(il) * 100  # Return as percentage
-    
+
+    def calculate_impermanent_loss_array(self, ratios: np.ndarray) -> np.ndarray:
+        """
+        Calculate impermanent loss for an array of price ratio changes
+
+        Vectorized variant of calculate_impermanent_loss for backtests
+        over historical price series: one C-level pass instead of a
+        Python call per point.
+
+        Args:
+            ratios: Array of current/initial price ratio changes
+
+        Returns:
+            Impermanent loss percentages, elementwise
+        """
+        ratios = np.asarray(ratios, dtype=np.float64)
+        return np.abs(2 * np.sqrt(ratios) / (1 + ratios) - 1) * 100
+
     def get_bridge_quote(self, 
                         from_chain: str, 
                         to_chain: str, 
@@ -270,52 +485,104 @@ class BaseEcosystemIntegration:
             'bridge_provider': 'Base Official Bridge'
         }
     
-    def monitor_gas_prices(self) -> Dict:
+    async def rpc_call(self, method: str, params: Optional[list] = None) -> Any:
+        """Make a single JSON-RPC call and return its result"""
+        payload = {
+            "jsonrpc": "2.0",
+            "method": method,
+            "params": params or [],
+            "id": 1
+        }
+        response = await self._fetch_json('POST', self.rpc_url, json=payload)
+        if response is None:
+            return None
+        return response.get('result')
+
+    async def rpc_batch(self, calls: List[Tuple[str, list]]) -> List[Any]:
+        """
+        Execute multiple JSON-RPC calls in one HTTP round trip
+
+        Packs the calls into a single JSON array per the JSON-RPC 2.0
+        batch spec and demultiplexes the responses by id. Batches are
+        capped at self.rpc_batch_size; when batching is disabled the
+        calls are issued individually but concurrently instead.
+
+        Args:
+            calls: List of (method, params) tuples
+
+        Returns:
+            Results in the same order as the input calls
+        """
+        if not calls:
+            return []
+
+        if not self.rpc_batching_enabled:
+            return list(await asyncio.gather(*(self.rpc_call(m, p) for m, p in calls)))
+
+        results: List[Any] = [None] * len(calls)
+        for start in range(0, len(calls), self.rpc_batch_size):
+            chunk = calls[start:start + self.rpc_batch_size]
+            payload = [
+                {"jsonrpc": "2.0", "method": method, "params": params, "id": start + i}
+                for i, (method, params) in enumerate(chunk)
+            ]
+            responses = await self._fetch_json('POST', self.rpc_url, json=payload)
+            if responses is None:
+                continue
+            for item in responses:
+                results[item['id']] = item.get('result')
+
+        return results
+
+    async def monitor_gas_prices(self) -> Dict:
         """
         Monitor current gas prices on Base
-        
+
         Returns:
             Current gas price information
         """
         try:
-            # Make RPC call to get gas price
-            payload = {
-                "jsonrpc": "2.0",
-                "method": "eth_gasPrice",
-                "params": [],
-                "id": 1
-            }
-            
-            response = self.session.post(self.rpc_url, json=payload, timeout=10)
-            if response.status_code == 200:
-                result = response.json()
-                gas_price_wei = int(result['result'], 16)
-                gas_price_gwei = gas_price_wei / 1e9
-                
+            # Fetch gas price, block height, and latest block in one round trip
+            gas_price, block_number, block = await self.rpc_batch([
+                ("eth_gasPrice", []),
+                ("eth_blockNumber", []),
+                ("eth_getBlockByNumber", ["latest", False])
+            ])
+
+            if gas_price is not None:
+                gas_price_gwei = int(gas_price, 16) / 1e9
+                base_fee = block.get('baseFeePerGas') if block else None
+
                 return {
                     'gas_price_gwei': gas_price_gwei,
                     'fast': gas_price_gwei * 1.2,
                     'standard': gas_price_gwei,
                     'safe': gas_price_gwei * 0.8,
+                    'block_number': int(block_number, 16) if block_number else None,
+                    'base_fee_gwei': int(base_fee, 16) / 1e9 if base_fee else None,
                     'timestamp': int(time.time())
                 }
-        
+
         except Exception as e:
             print(f"Error fetching gas prices: {e}")
-        
+
         return {'error': 'Unable to fetch gas prices'}
     
-    def _get_direct_pools(self, token_in: str, token_out: str) -> List[Dict]:
-        """Get direct trading pools between two tokens"""
+    def _get_direct_pools(self, token_in: str, token_out: str) -> Dict[str, np.ndarray]:
+        """
+        Get direct trading pools between two tokens
+
+        Returns a structure-of-arrays layout (parallel arrays per field)
+        so route scoring runs as one contiguous vectorized pass instead
+        of iterating a list of dicts.
+        """
         # Placeholder implementation
-        return [
-            {
-                'address': '0x...',
-                'reserve_in': 1000000,
-                'reserve_out': 2000000,
-                'fee_rate': 0.003
-            }
-        ]
+        return {
+            'addresses': np.array(['0x...'], dtype=object),
+            'reserves_in': np.array([1000000.0]),
+            'reserves_out': np.array([2000000.0]),
+            'fee_rates': np.array([0.003])
+        }
     
     def _get_multi_hop_routes(self, token_in: str, token_out: str) -> List[List[str]]:
         """Get multi-hop routes between tokens"""
@@ -333,10 +600,10 @@ class BaseEcosystemIntegration:
         return (amount_in / reserve_in) * 100
 
 # Example usage and utility functions
-def main():
+async def main():
     """Example usage of Base ecosystem integration"""
     base_integration = BaseEcosystemIntegration(BaseNetwork.MAINNET)
-    
+
     print("=== Base Ecosystem Integration Demo ===")
     
     # Get farming opportunities
@@ -357,10 +624,12 @@ def main():
     
     # Monitor gas prices
     print("\n4. Current Gas Prices:")
-    gas_info = base_integration.monitor_gas_prices()
+    gas_info = await base_integration.monitor_gas_prices()
     if 'gas_price_gwei' in gas_info:
         print(f"   Standard: {gas_info['standard']:.2f} gwei")
         print(f"   Fast: {gas_info['fast']:.2f} gwei")
 
+    await base_integration.close()
+
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
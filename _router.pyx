@@ -0,0 +1,42 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled constant-product router kernels
+========================================
+
+Hot-loop helpers for BaseEcosystemIntegration's route search. Arbitrage
+scans score thousands of candidate pools per block; these kernels run
+the scoring loop at C speed with the GIL released.
+
+Build in place with:
+
+    cythonize -i _router.pyx
+
+(set CFLAGS="-O3 -march=native -ffast-math" first for auto-vectorized
+builds). BaseEcosystemIntegration falls back to the NumPy path when the
+extension is not compiled.
+"""
+
+from libc.math cimport floor
+
+
+cpdef double swap_out(double amount_in, double reserve_in, double reserve_out,
+                      double fee_rate) nogil:
+    """Constant-product swap output in Uniswap V2 fixed-point fee form."""
+    cdef double fee_num
+    if reserve_in <= 0.0 or reserve_out <= 0.0:
+        return 0.0
+    fee_num = floor((1.0 - fee_rate) * 1000.0)
+    return amount_in * fee_num * reserve_out / (reserve_in * 1000.0 + amount_in * fee_num)
+
+
+cpdef Py_ssize_t best_route(double[::1] reserves_in, double[::1] reserves_out,
+                            double[::1] fee_rates, double amount_in) nogil:
+    """Index of the pool with the highest swap output for amount_in."""
+    cdef Py_ssize_t i, best = 0
+    cdef double out, best_out = -1.0
+    for i in range(reserves_in.shape[0]):
+        out = swap_out(amount_in, reserves_in[i], reserves_out[i], fee_rates[i])
+        if out > best_out:
+            best_out = out
+            best = i
+    return best
